@@ -1,5 +1,13 @@
 from abc import ABC, abstractmethod, ABCMeta
 from datetime import datetime
+from functools import reduce
+import csv
+import io
+import json
+import os
+import time
+from math import prod
+from operator import truediv
 import uuid
 
 from sqlalchemy import (
@@ -10,10 +18,24 @@ from sqlalchemy import (
     JSON,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, load_only, relationship, validates
 from sqlalchemy.ext.declarative import DeclarativeMeta
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds followed by 12 bits of
+    sub-millisecond precision, so new rows append to the right edge of the index.
+    """
+    ms, sub_ms = divmod(time.time_ns(), 1_000_000)
+    rand_a = sub_ms * 4096 // 1_000_000
+    rand_b = int.from_bytes(os.urandom(8), 'big') & 0x3FFF_FFFF_FFFF_FFFF
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
+
+
 # Define a custom metaclass combining DeclarativeMeta and ABCMeta
 class MyMeta(DeclarativeMeta, ABCMeta):
     pass
@@ -27,7 +49,7 @@ Base = declarative_base(metaclass=MyMeta)
 class User(Base):
     __tablename__ = 'users'
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)  # UUID primary key
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)  # UUID primary key
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False)
     email = Column(String(120), unique=True, nullable=False)
@@ -36,11 +58,12 @@ class User(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
-    # Relationship with Calculation
+    # Relationship with Calculation, loaded with one SELECT ... IN per batch of users (avoids N+1)
     calculations = relationship(
         "Calculation",
         back_populates="user",
-        cascade="all, delete, delete-orphan"
+        cascade="all, delete, delete-orphan",
+        lazy="selectin",
     )
 
     def __repr__(self):
@@ -51,8 +74,8 @@ class User(Base):
 class Calculation(Base, ABC):
     __tablename__ = 'calculations'
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)  # UUID primary key
-    user_id = Column(PG_UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)  # Foreign key to User
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)  # UUID primary key
+    user_id = Column(PG_UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)  # Indexed foreign key to User
     type = Column(String(50), nullable=False)  # Type of calculation (e.g., "addition", "subtraction")
     inputs = Column(JSON, nullable=False)  # JSON field to store inputs as a list
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -64,25 +87,91 @@ class Calculation(Base, ABC):
     __mapper_args__ = {
         'polymorphic_on': type,
         'polymorphic_identity': 'calculation',
-        'with_polymorphic': '*',
     }
 
+    # Minimum number of inputs a calculation of this type needs
+    min_inputs = 0
+
     @classmethod
     def create(cls, calculation_type: str, user_id: uuid.UUID, inputs: list[float]) -> 'Calculation':
         """
         Factory method to create Calculation instances based on the calculation type.
         """
-        calculation_classes = {
-            'addition': Addition,
-            'subtraction': Subtraction,
-            'multiplication': Multiplication,
-            'division': Division,
-        }
-        calculation_class = calculation_classes.get(calculation_type.lower())
+        calculation_class = _CALC_TYPES.get(calculation_type.lower())
         if not calculation_class:
             raise ValueError(f"Unsupported calculation type: {calculation_type}")
         return calculation_class(user_id=user_id, inputs=inputs)
 
+    @classmethod
+    def list_for_user(cls, session, user_id: uuid.UUID) -> list['Calculation']:
+        """
+        Fetch a user's calculations, loading only the columns needed to compute results.
+
+        Other columns (user_id, timestamps) are loaded lazily if accessed.
+        """
+        return (
+            session.query(cls)
+            .options(load_only(cls.id, cls.type, cls.inputs))
+            .filter(cls.user_id == user_id)
+            .all()
+        )
+
+    @classmethod
+    def bulk_create_copy(cls, session, rows: list['Calculation']) -> list['Calculation']:
+        """
+        Persist many calculations at once using PostgreSQL COPY.
+
+        Rows are streamed to the server as CSV in the session's current transaction.
+        On other databases (e.g. SQLite in tests) this falls back to bulk_save_objects.
+        """
+        now = datetime.utcnow()
+        for row in rows:
+            # COPY bypasses the ORM, so apply the column defaults here
+            row.id = row.id or uuid7()
+            row.created_at = row.created_at or now
+            row.updated_at = row.updated_at or now
+
+        # Neither COPY nor bulk_save_objects autoflushes, so write pending rows
+        # (e.g. the users these calculations point at) first
+        session.flush()
+
+        if session.get_bind().dialect.name != 'postgresql':
+            session.bulk_save_objects(rows)
+            return rows
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter='\t')
+        for row in rows:
+            writer.writerow([
+                str(row.id),
+                str(row.user_id),
+                row.type,
+                json.dumps(row.inputs),
+                row.created_at.isoformat(),
+                row.updated_at.isoformat(),
+            ])
+        buffer.seek(0)
+
+        raw = session.connection().connection
+        with raw.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY calculations (id, user_id, type, inputs, created_at, updated_at) "
+                "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t')",
+                buffer,
+            )
+        return rows
+
+    @validates('inputs')
+    def _check_inputs(self, key, value):
+        """
+        Validate inputs once on assignment so get_result can stay compute-only.
+        """
+        if not isinstance(value, list):
+            raise ValueError("Inputs must be a list of numbers.")
+        if len(value) < self.min_inputs:
+            raise ValueError(f"Inputs must be a list with at least {self.min_inputs} numbers.")
+        return value
+
     @abstractmethod
     def get_result(self) -> float:
         """
@@ -102,8 +191,6 @@ class Addition(Calculation):
     }
 
     def get_result(self) -> float:
-        if not isinstance(self.inputs, list):
-            raise ValueError("Inputs must be a list of numbers.")
         return sum(self.inputs)
 
 
@@ -112,14 +199,10 @@ class Subtraction(Calculation):
     __mapper_args__ = {
         'polymorphic_identity': 'subtraction',
     }
+    min_inputs = 2
 
     def get_result(self) -> float:
-        if not isinstance(self.inputs, list) or len(self.inputs) < 2:
-            raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
-            result -= value
-        return result
+        return self.inputs[0] - sum(self.inputs[1:])
 
 
 # Subclass for Multiplication
@@ -129,12 +212,7 @@ class Multiplication(Calculation):
     }
 
     def get_result(self) -> float:
-        if not isinstance(self.inputs, list):
-            raise ValueError("Inputs must be a list of numbers.")
-        result = 1
-        for value in self.inputs:
-            result *= value
-        return result
+        return prod(self.inputs)
 
 
 # Subclass for Division
@@ -142,13 +220,18 @@ class Division(Calculation):
     __mapper_args__ = {
         'polymorphic_identity': 'division',
     }
+    min_inputs = 2
 
     def get_result(self) -> float:
-        if not isinstance(self.inputs, list) or len(self.inputs) < 2:
-            raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
-            if value == 0:
-                raise ValueError("Cannot divide by zero.")
-            result /= value
-        return result
\ No newline at end of file
+        if 0 in self.inputs[1:]:
+            raise ValueError("Cannot divide by zero.")
+        return reduce(truediv, self.inputs)
+
+
+# Map of calculation type names to their subclasses, used by Calculation.create
+_CALC_TYPES = {
+    'addition': Addition,
+    'subtraction': Subtraction,
+    'multiplication': Multiplication,
+    'division': Division,
+}
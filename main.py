@@ -1,103 +1,225 @@
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.exceptions import RequestValidationError  # <-- Add this import
-from pydantic import BaseModel, Field
-import requests
+from pydantic import BaseModel, ConfigDict, Field
+import httpx
+import msgspec
+import operator
+import orjson
 import os
+import re
+from typing import Annotated, Optional
 import logging
+import math
 import uvicorn
+from collections import OrderedDict
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Setup FastAPI app
-app = FastAPI()
+# Setup FastAPI app (orjson serializes responses faster than the stdlib json module)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Setup templates directory
 templates = Jinja2Templates(directory="templates")
 
+# index.html uses no per-request context, so it is rendered once and reused
+_INDEX_HTML: Optional[bytes] = None
+
+def _index_html() -> bytes:
+    """
+    Return the rendered index.html, rendering it on first use.
+    """
+    global _INDEX_HTML
+    if _INDEX_HTML is None:
+        _INDEX_HTML = templates.get_template("index.html").render().encode()
+    return _INDEX_HTML
+
 # API Configuration
 API_ENDPOINT = "https://api.groq.com/openai/v1/chat/completions"
 API_KEY = os.getenv("API_KEY")  # Ensure your .env file contains API_KEY
+LLM_MODEL = "llama-3.2-1b-preview"
+
+# Constant parts of every LLM request, built once at import (headers are set on the shared client)
+_HEADERS = {
+    "Authorization": f"Bearer {API_KEY}",
+    "Content-Type": "application/json",
+}
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful assistant that suggests mathematical operations."}
 
-# Pydantic model for operation input data
-class OperationRequest(BaseModel):
-    a: float = Field(..., description="The first number")
-    b: float = Field(..., description="The second number")
+# Matches the first operation keyword in an LLM reply (also catches "addition", "divided", ...)
+_OP_RE = re.compile(r"\b(add|subtract|multiply|divide)", re.IGNORECASE)
+_OP_MAP = {"add": "add", "subtract": "subtract", "multiply": "multiply", "divide": "divide"}
 
-# Pydantic model for operation response
+# LRU cache of LLM suggestions keyed on the normalized query (one cache per worker process)
+_LLM_CACHE = OrderedDict()
+_LLM_CACHE_SIZE = 1024
+
+# Arithmetic function for each operation the LLM can suggest
+_OP_FNS = {"add": operator.add, "subtract": operator.sub, "multiply": operator.mul, "divide": operator.truediv}
+
+# Shared async HTTP client for LLM calls, created on startup and closed on shutdown.
+# Its connection pool keeps TLS connections to the LLM API alive between requests.
+client: Optional[httpx.AsyncClient] = None
+_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=30.0)
+
+def _llm_client() -> httpx.AsyncClient:
+    """
+    Return the shared LLM client, creating it on first use if startup has not run.
+    """
+    global client
+    if client is None:
+        client = httpx.AsyncClient(headers=_HEADERS, timeout=30.0, limits=_CLIENT_LIMITS)
+    return client
+
+@app.on_event("startup")
+async def startup_event():
+    _llm_client()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    global client
+    if client is not None:
+        await client.aclose()
+        client = None
+
+# msgspec struct for operation input data (JSON is parsed and validated in a single pass)
+class OperationRequest(msgspec.Struct):
+    a: Annotated[float, msgspec.Meta(description="The first number")]
+    b: Annotated[float, msgspec.Meta(description="The second number")]
+
+# Pydantic model for operation response (documents the OpenAPI schema only)
 class OperationResponse(BaseModel):
     result: float = Field(..., description="The result of the operation")
 
-# Pydantic model for error response
+# Pydantic model for error response (documents the OpenAPI schema only)
 class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
 
-# Pydantic model for LLM request data
-class LLMRequest(BaseModel):
-    query: str = Field(..., description="User query for LLM")
+# msgspec struct for LLM request data
+class LLMRequest(msgspec.Struct):
+    query: Annotated[str, msgspec.Meta(description="User query for LLM")]
+
+# msgspec struct for the /llm/execute request body
+class LLMExecuteRequest(msgspec.Struct):
+    operation: OperationRequest
+    llm_request: LLMRequest
 
-# Pydantic model for LLM response
+# Pydantic model for LLM response (built on every LLM call, so kept free of Field metadata)
 class LLMResponse(BaseModel):
-    operation: str = Field(..., description="Suggested operation")
-    explanation: str = Field(..., description="Explanation from LLM")
+    model_config = ConfigDict(extra='forbid')
+    operation: str  # Suggested operation
+    explanation: str  # Explanation from LLM
+
+# msgspec error messages, e.g. "Expected `float`, got `null` - at `$.operation.a`"
+_MSGSPEC_ERROR_RE = re.compile(r"(?P<msg>.*?)(?: - at `\$(?P<path>.*)`)?")
+_MISSING_FIELD_RE = re.compile(r"Object missing required field `(?P<field>.+)`")
+_EXPECTED_TYPE_RE = re.compile(r"Expected `(?P<type>\w+)`.*")
+_EXPECTED_TYPE_MSGS = {"float": "Input should be a valid number", "str": "Input should be a valid string"}
+
+def _validation_error(exc: msgspec.DecodeError) -> RequestValidationError:
+    """
+    Convert a msgspec error into a RequestValidationError so it is reported in the
+    same "<field>: <msg>" format as FastAPI's own validation errors.
+    """
+    if not isinstance(exc, msgspec.ValidationError):
+        return RequestValidationError([{"loc": ("body",), "msg": "JSON decode error", "type": "json_invalid"}])
+    match = _MSGSPEC_ERROR_RE.fullmatch(str(exc))
+    msg, path = match.group("msg"), match.group("path") or ""
+    loc = ["body", *(part for part in re.split(r"[.\[\]]", path) if part)]
+    missing = _MISSING_FIELD_RE.fullmatch(msg)
+    if missing:
+        loc.append(missing.group("field"))
+        msg = "Field required"
+    else:
+        expected = _EXPECTED_TYPE_RE.fullmatch(msg)
+        if expected:
+            msg = _EXPECTED_TYPE_MSGS.get(expected.group("type"), msg)
+    return RequestValidationError([{"loc": tuple(loc), "msg": msg, "type": "value_error"}])
+
+# Request body dependencies decoding JSON straight into msgspec structs
+# (strict=False keeps Pydantic's lax coercion, e.g. numeric strings for floats)
+def _decode_body(decoder: msgspec.json.Decoder):
+    async def dependency(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:  # Also covers msgspec.ValidationError
+            raise _validation_error(e)
+    return dependency
+
+operation_body = _decode_body(msgspec.json.Decoder(OperationRequest, strict=False))
+llm_execute_body = _decode_body(msgspec.json.Decoder(LLMExecuteRequest, strict=False))
+
+# FastAPI cannot introspect msgspec structs, so their schemas are added to the OpenAPI document by hand
+(_OPERATION_SCHEMA, _LLM_EXECUTE_SCHEMA), _STRUCT_SCHEMAS = msgspec.json.schema_components(
+    [OperationRequest, LLMExecuteRequest], ref_template="#/components/schemas/{name}"
+)
+
+def _json_body(schema: dict) -> dict:
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+def custom_openapi():
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(_STRUCT_SCHEMAS)
+    return app.openapi_schema
+
+app.openapi = custom_openapi
 
 # Custom Exception Handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     logger.error(f"HTTPException on {request.url.path}: {exc.detail}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail},
     )
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    error_messages = "; ".join([f"{err['loc'][-1]}: {err['msg']}" for err in exc.errors()])
+    error_messages = "; ".join(f"{err['loc'][-1]}: {err['msg']}" for err in exc.errors())
     logger.error(f"ValidationError on {request.url.path}: {error_messages}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"error": error_messages},
     )
 
 # Function to interact with the LLM API and get operation suggestion
-def perform_llm_operation(query: str) -> LLMResponse:
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json",
-    }
+async def perform_llm_operation(query: str) -> LLMResponse:
+    # Repeated queries are answered from the cache without calling the LLM API
+    key = query.strip().lower()
+    cached = _LLM_CACHE.get(key)
+    if cached is not None:
+        _LLM_CACHE.move_to_end(key)
+        return cached
+
     payload = {
-        "model": "llama-3.2-1b-preview",
-        "messages": [
-            {"role": "system", "content": "You are a helpful assistant that suggests mathematical operations."},
-            {"role": "user", "content": query},
-        ],
+        "model": LLM_MODEL,
+        "messages": [_SYSTEM_MSG, {"role": "user", "content": query}],
     }
 
     try:
-        response = requests.post(API_ENDPOINT, headers=headers, json=payload)
+        response = await _llm_client().post(API_ENDPOINT, json=payload)
         response.raise_for_status()  # Raise an error for bad HTTP status codes
-        result = response.json()
+        result = orjson.loads(response.content)  # Parse the raw UTF-8 bytes directly
 
         # Parse the LLM response
         suggestion = result["choices"][0]["message"]["content"]
 
         # Determine the operation
-        if "add" in suggestion.lower():
-            operation = "add"
-        elif "subtract" in suggestion.lower():
-            operation = "subtract"
-        elif "multiply" in suggestion.lower():
-            operation = "multiply"
-        elif "divide" in suggestion.lower():
-            operation = "divide"
-        else:
+        match = _OP_RE.search(suggestion)
+        if not match:
             raise ValueError("Unable to determine operation from LLM response.")
+        operation = _OP_MAP[match.group(1).lower()]
 
-        return LLMResponse(operation=operation, explanation=suggestion)
-    except requests.RequestException as e:
+        llm_response = LLMResponse(operation=operation, explanation=suggestion)
+        _LLM_CACHE[key] = llm_response
+        if len(_LLM_CACHE) > _LLM_CACHE_SIZE:
+            _LLM_CACHE.popitem(last=False)  # Evict the least recently used query
+        return llm_response
+    except httpx.HTTPError as e:
         logger.error(f"LLM API Request Error: {str(e)}")
         raise HTTPException(status_code=400, detail="Error communicating with LLM API.")
     except Exception as e:
@@ -106,44 +228,68 @@ def perform_llm_operation(query: str) -> LLMResponse:
 
 # Operation Routes
 
-@app.post("/add", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
-async def add_route(operation: OperationRequest):
+def _result(value: float) -> dict:
+    """
+    Build an operation response, rejecting inf/nan results (orjson would write them as null).
+    """
+    if not math.isfinite(value):
+        raise HTTPException(status_code=400, detail="Result is out of range")
+    return {"result": value}
+
+@app.post(
+    "/add",
+    responses={200: {"model": OperationResponse}, 400: {"model": ErrorResponse}},
+    openapi_extra=_json_body(_OPERATION_SCHEMA),
+)
+def add_route(operation: OperationRequest = Depends(operation_body)):
     """
     Add two numbers.
     """
     try:
         result = operation.a + operation.b
-        return OperationResponse(result=result)
     except Exception as e:
         logger.error(f"Add Operation Error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    return _result(result)
 
-@app.post("/subtract", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
-async def subtract_route(operation: OperationRequest):
+@app.post(
+    "/subtract",
+    responses={200: {"model": OperationResponse}, 400: {"model": ErrorResponse}},
+    openapi_extra=_json_body(_OPERATION_SCHEMA),
+)
+def subtract_route(operation: OperationRequest = Depends(operation_body)):
     """
     Subtract two numbers.
     """
     try:
         result = operation.a - operation.b
-        return OperationResponse(result=result)
     except Exception as e:
         logger.error(f"Subtract Operation Error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    return _result(result)
 
-@app.post("/multiply", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
-async def multiply_route(operation: OperationRequest):
+@app.post(
+    "/multiply",
+    responses={200: {"model": OperationResponse}, 400: {"model": ErrorResponse}},
+    openapi_extra=_json_body(_OPERATION_SCHEMA),
+)
+def multiply_route(operation: OperationRequest = Depends(operation_body)):
     """
     Multiply two numbers.
     """
     try:
         result = operation.a * operation.b
-        return OperationResponse(result=result)
     except Exception as e:
         logger.error(f"Multiply Operation Error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    return _result(result)
 
-@app.post("/divide", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
-async def divide_route(operation: OperationRequest):
+@app.post(
+    "/divide",
+    responses={200: {"model": OperationResponse}, 400: {"model": ErrorResponse}},
+    openapi_extra=_json_body(_OPERATION_SCHEMA),
+)
+def divide_route(operation: OperationRequest = Depends(operation_body)):
     """
     Divide two numbers.
     """
@@ -151,44 +297,42 @@ async def divide_route(operation: OperationRequest):
         if operation.b == 0:
             raise ValueError("Cannot divide by zero!")
         result = operation.a / operation.b
-        return OperationResponse(result=result)
     except ValueError as e:
         logger.error(f"Divide Operation Error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Divide Operation Internal Error: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
+    return _result(result)
 
 # Route to perform operation using LLM suggestion
-@app.post("/llm/execute", response_model=OperationResponse)
-async def llm_execute(operation: OperationRequest, llm_request: LLMRequest):
+@app.post(
+    "/llm/execute",
+    responses={200: {"model": OperationResponse}, 400: {"model": ErrorResponse}},
+    openapi_extra=_json_body(_LLM_EXECUTE_SCHEMA),
+)
+async def llm_execute(body: LLMExecuteRequest = Depends(llm_execute_body)):
     """
     Execute the operation suggested by the LLM.
     """
-    llm_suggestion = perform_llm_operation(llm_request.query)
+    operation = body.operation
+    llm_suggestion = await perform_llm_operation(body.llm_request.query)
 
-    if llm_suggestion.operation == "add":
-        result = operation.a + operation.b
-    elif llm_suggestion.operation == "subtract":
-        result = operation.a - operation.b
-    elif llm_suggestion.operation == "multiply":
-        result = operation.a * operation.b
-    elif llm_suggestion.operation == "divide":
-        if operation.b == 0:
-            raise HTTPException(status_code=400, detail="Cannot divide by zero")
-        result = operation.a / operation.b
-    else:
+    fn = _OP_FNS.get(llm_suggestion.operation)
+    if fn is None:
         raise HTTPException(status_code=400, detail="Unsupported operation suggested by LLM.")
+    if fn is operator.truediv and operation.b == 0:
+        raise HTTPException(status_code=400, detail="Cannot divide by zero")
 
-    return OperationResponse(result=result)
+    return _result(fn(operation.a, operation.b))
 
 # Route to serve the main template (form)
-@app.get("/")
-async def read_root(request: Request):
+@app.get("/", response_class=HTMLResponse)
+async def read_root():
     """
-    Serve the index.html template.
+    Serve the index.html template, rendered once and cached.
     """
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(_index_html())
 
 if __name__ == "__main__":
     uvicorn.run(app, host="127.0.0.1", port=8000)
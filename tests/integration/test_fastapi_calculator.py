@@ -1,7 +1,11 @@
 # tests/integration/test_fastapi_calculator.py
 
+import asyncio  # Import asyncio to close the mocked LLM clients
+from collections import OrderedDict  # Import OrderedDict to reset the LLM suggestion cache
+import httpx  # Import httpx to mock the LLM API transport
 import pytest  # Import the pytest framework for writing and running tests
 from fastapi.testclient import TestClient  # Import TestClient for simulating API requests
+import main  # Import the main module so the shared LLM client can be swapped out
 from main import app  # Import the FastAPI app instance from your main application file
 
 # ---------------------------------------------
@@ -24,6 +28,36 @@ def client():
     with TestClient(app) as client:
         yield client  # Provide the TestClient instance to the test functions
 
+# ---------------------------------------------
+# Test Function: test_read_root
+# ---------------------------------------------
+
+def test_read_root(client):
+    """
+    Test that the root endpoint serves the calculator page.
+
+    Steps:
+    1. Send a GET request to `/`.
+    2. Assert that the response is `200 OK` HTML containing the page header.
+    """
+    response = client.get('/')
+
+    assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
+    assert response.headers['content-type'].startswith('text/html')
+    assert '<h1>Hello World</h1>' in response.text
+
+def test_read_root_without_startup(monkeypatch):
+    """
+    Test that the root endpoint renders the page even when the startup hooks have not run.
+
+    A TestClient that is not used as a context manager never triggers startup events.
+    """
+    monkeypatch.setattr(main, "_INDEX_HTML", None)
+    response = TestClient(app).get('/')
+
+    assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
+    assert '<h1>Hello World</h1>' in response.text
+
 # ---------------------------------------------
 # Test Function: test_add_api
 # ---------------------------------------------
@@ -151,4 +185,266 @@ def test_divide_by_zero_api(client):
     
     # Assert that the 'error' field contains the correct error message
     assert "Cannot divide by zero!" in response.json()['error'], \
-        f"Expected error message 'Cannot divide by zero!', got '{response.json()['error']}'"
\ No newline at end of file
+        f"Expected error message 'Cannot divide by zero!', got '{response.json()['error']}'"
+
+# ---------------------------------------------
+# Test Function: test_result_out_of_range_api
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "endpoint, payload",
+    [
+        ('/multiply', {'a': 1e308, 'b': 1e308}),   # Test a product that overflows to infinity
+        ('/add', {'a': 1.7e308, 'b': 1.7e308}),    # Test a sum that overflows to infinity
+    ],
+    ids=[
+        "multiply_overflow",
+        "add_overflow",
+    ]
+)
+def test_result_out_of_range_api(client, endpoint, payload):
+    """
+    Test that a result which overflows to infinity is rejected instead of returned as null.
+
+    Steps:
+    1. Send a POST request whose result is too large to represent.
+    2. Assert that the response status code is `400 Bad Request`.
+    3. Assert that the 'error' field reports the result as out of range.
+    """
+    response = client.post(endpoint, json=payload)
+
+    assert response.status_code == 400, f"Expected status code 400, got {response.status_code}"
+    assert response.json()['error'] == "Result is out of range", \
+        f"Expected error 'Result is out of range', got '{response.json()['error']}'"
+
+# ---------------------------------------------
+# Test Function: test_numeric_strings_api
+# ---------------------------------------------
+
+def test_numeric_strings_api(client):
+    """
+    Test that numeric strings are coerced to numbers, as the API has always accepted them.
+
+    Steps:
+    1. Send a POST request to the `/add` endpoint with JSON data `{'a': '10', 'b': '5'}`.
+    2. Assert that the response status code is `200 OK` and the result is `15`.
+    """
+    response = client.post('/add', json={'a': '10', 'b': '5'})
+
+    assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
+    assert response.json()['result'] == 15, f"Expected result 15, got {response.json()['result']}"
+
+# ---------------------------------------------
+# Test Function: test_invalid_body_api
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "endpoint, payload, expected_error",
+    [
+        ('/add', {'a': 10}, "b: Field required"),                                   # Test a body missing the second number
+        ('/add', {'a': 'ten', 'b': 5}, "a: Input should be a valid number"),        # Test a body with a non-numeric value
+        ('/add', {'a': None, 'b': 5}, "a: Input should be a valid number"),         # Test a cleared input (sent as null)
+        ('/llm/execute', {'operation': {'a': 10}, 'llm_request': {'query': 'Add'}},
+         "b: Field required"),                                                      # Test a nested body missing a number
+        ('/llm/execute', {'operation': {'a': 10, 'b': 5}, 'llm_request': {'query': 1}},
+         "query: Input should be a valid string"),                                  # Test a nested body with a non-string query
+    ],
+    ids=[
+        "missing_field",
+        "non_numeric_value",
+        "null_value",
+        "nested_missing_field",
+        "nested_non_string_value",
+    ]
+)
+def test_invalid_body_api(client, endpoint, payload, expected_error):
+    """
+    Test that an invalid request body is rejected with a "<field>: <message>" error.
+
+    Steps:
+    1. Send a POST request with an invalid JSON payload.
+    2. Assert that the response status code is `400 Bad Request`.
+    3. Assert that the 'error' field names the offending field and the problem.
+    """
+    response = client.post(endpoint, json=payload)
+
+    assert response.status_code == 400, f"Expected status code 400, got {response.status_code}"
+    assert response.json()['error'] == expected_error, \
+        f"Expected error '{expected_error}', got '{response.json()['error']}'"
+
+# ---------------------------------------------
+# Test Function: test_malformed_json_api
+# ---------------------------------------------
+
+def test_malformed_json_api(client):
+    """
+    Test that a body which is not valid JSON is rejected.
+    """
+    response = client.post('/add', content=b'{"a": 10,', headers={'Content-Type': 'application/json'})
+
+    assert response.status_code == 400, f"Expected status code 400, got {response.status_code}"
+    assert response.json()['error'] == "body: JSON decode error"
+
+# ---------------------------------------------
+# Pytest Fixture: mock_llm_transport
+# ---------------------------------------------
+
+@pytest.fixture
+def mock_llm_transport(client, monkeypatch):
+    """
+    Pytest Fixture to replace the shared LLM HTTP client with a mocked transport.
+
+    The returned function takes an httpx request handler and installs an
+    `httpx.AsyncClient` that routes every request through it, so the `/llm/execute`
+    endpoint can be tested without calling the real Groq API. Each test also starts
+    with an empty LLM suggestion cache, and the mocked clients are closed on teardown.
+    """
+    mock_clients = []
+
+    def install(handler):
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mock_clients.append(mock_client)
+        monkeypatch.setattr(main, "client", mock_client)
+        monkeypatch.setattr(main, "_LLM_CACHE", OrderedDict())
+
+    yield install
+
+    for mock_client in mock_clients:
+        asyncio.run(mock_client.aclose())
+
+# ---------------------------------------------
+# Pytest Fixture: mock_llm
+# ---------------------------------------------
+
+@pytest.fixture
+def mock_llm(mock_llm_transport):
+    """
+    Pytest Fixture to mock the LLM API with a fixed reply.
+
+    The returned function takes the text the LLM should reply with, installs a mocked
+    transport answering every request with that content, and returns the list of
+    requests the mocked API received.
+    """
+    def install(content: str):
+        calls = []
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+        mock_llm_transport(handler)
+        return calls
+    return install
+
+# ---------------------------------------------
+# Test Function: test_llm_execute_api
+# ---------------------------------------------
+
+def test_llm_execute_api(client, mock_llm):
+    """
+    Test the LLM Execute API Endpoint.
+
+    This test verifies that the `/llm/execute` endpoint applies the operation suggested
+    by the LLM to the numbers provided in the JSON payload.
+
+    Steps:
+    1. Mock the LLM to suggest multiplication.
+    2. Send a POST request to `/llm/execute` with `{'a': 10, 'b': 5}` and a query.
+    3. Assert that the response status code is `200 OK` and the result is `50`.
+    """
+    mock_llm("You should multiply these numbers.")
+    response = client.post('/llm/execute', json={
+        'operation': {'a': 10, 'b': 5},
+        'llm_request': {'query': 'What is 10 times 5?'},
+    })
+
+    assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
+    assert response.json()['result'] == 50, f"Expected result 50, got {response.json()['result']}"
+
+# ---------------------------------------------
+# Test Function: test_llm_execute_api_cached
+# ---------------------------------------------
+
+def test_llm_execute_api_cached(client, mock_llm):
+    """
+    Test that repeated LLM queries are answered from the suggestion cache.
+
+    Steps:
+    1. Mock the LLM to suggest addition.
+    2. Send the same query twice, differing only in case and surrounding whitespace.
+    3. Assert that both requests succeed but the LLM API was called only once.
+    """
+    calls = mock_llm("Add them together.")
+    for query in ['Add these numbers', '  add THESE numbers ']:
+        response = client.post('/llm/execute', json={
+            'operation': {'a': 10, 'b': 5},
+            'llm_request': {'query': query},
+        })
+        assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
+        assert response.json()['result'] == 15, f"Expected result 15, got {response.json()['result']}"
+
+    assert len(calls) == 1, f"Expected 1 LLM API call, got {len(calls)}"
+
+# ---------------------------------------------
+# Test Function: test_llm_execute_api_unknown_operation
+# ---------------------------------------------
+
+def test_llm_execute_api_unknown_operation(client, mock_llm):
+    """
+    Test the LLM Execute API Endpoint when the LLM reply names no operation.
+
+    Steps:
+    1. Mock the LLM to reply without any operation keyword.
+    2. Send a POST request to `/llm/execute`.
+    3. Assert that the response status code is `400 Bad Request` with a descriptive error.
+    """
+    mock_llm("I am not sure what you mean.")
+    response = client.post('/llm/execute', json={
+        'operation': {'a': 10, 'b': 5},
+        'llm_request': {'query': 'Hello'},
+    })
+
+    assert response.status_code == 400, f"Expected status code 400, got {response.status_code}"
+    assert "Unable to determine operation" in response.json()['error']
+
+# ---------------------------------------------
+# Test Function: test_llm_execute_api_error
+# ---------------------------------------------
+
+def test_llm_execute_api_error(client, mock_llm_transport):
+    """
+    Test the LLM Execute API Endpoint when the LLM API is unreachable.
+
+    Steps:
+    1. Mock the LLM transport to raise a connection error.
+    2. Send a POST request to `/llm/execute`.
+    3. Assert that the response status code is `400 Bad Request` with an 'error' field.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+    mock_llm_transport(handler)
+
+    response = client.post('/llm/execute', json={
+        'operation': {'a': 10, 'b': 5},
+        'llm_request': {'query': 'Add these'},
+    })
+
+    assert response.status_code == 400, f"Expected status code 400, got {response.status_code}"
+    assert response.json()['error'] == "Error communicating with LLM API."
+
+# ---------------------------------------------
+# Test Function: test_llm_client_created_lazily
+# ---------------------------------------------
+
+def test_llm_client_created_lazily(monkeypatch):
+    """
+    Test that the shared LLM client is created on first use when the startup hooks have not run.
+
+    A TestClient that is not used as a context manager never triggers startup events.
+    """
+    monkeypatch.setattr(main, "client", None)
+
+    llm_client = main._llm_client()
+
+    assert isinstance(llm_client, httpx.AsyncClient), "Expected an httpx.AsyncClient"
+    assert main._llm_client() is llm_client, "Expected the same client to be reused"
+    assert llm_client.headers['Content-Type'] == 'application/json'
+    asyncio.run(llm_client.aclose())
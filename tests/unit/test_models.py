@@ -0,0 +1,249 @@
+# tests/unit/test_models.py
+
+import csv  # Import csv to read back the COPY buffer
+import io  # Import io to wrap the captured COPY buffer
+import json  # Import json to decode the copied inputs
+import uuid  # Import uuid to generate user ids for the calculations
+
+import pytest  # Import the pytest framework for writing and running tests
+from sqlalchemy import create_engine  # Import create_engine for an in-memory test database
+from sqlalchemy.orm import sessionmaker  # Import sessionmaker to open sessions on the test database
+from app.models import Base, User, Calculation, Addition, Subtraction, Multiplication, Division, uuid7  # Import the models
+
+
+# ---------------------------------------------
+# Pytest Fixture: db_session
+# ---------------------------------------------
+
+@pytest.fixture
+def db_session():
+    """
+    Pytest Fixture providing a session bound to a fresh in-memory SQLite database.
+    """
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+# ---------------------------------------------
+# Unit Tests for 'Calculation.get_result'
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "calculation_type, inputs, expected",
+    [
+        ("addition", [1, 2, 3], 6),            # Test adding several numbers
+        ("subtraction", [10, 3, 2], 5),        # Test subtracting several numbers
+        ("multiplication", [2, 3, 4], 24),     # Test multiplying several numbers
+        ("division", [100, 5, 2], 10.0),       # Test dividing several numbers
+        ("subtraction", [1000.0] + [1.0] * 99, 901.0),    # Test a large float subtraction input list
+        ("multiplication", [1.0] * 99 + [2.0], 2.0),       # Test a large float multiplication input list
+        ("division", [2.0 ** 100] + [2.0] * 99, 2.0),      # Test a large float division input list
+        ("subtraction", [10 ** 17 + 1] + [1] * 70, 10 ** 17 - 69),  # Test large integer inputs stay exact
+        ("multiplication", [3] * 70, 3 ** 70),                      # Test large integer inputs stay exact
+    ],
+    ids=[
+        "addition_result",
+        "subtraction_result",
+        "multiplication_result",
+        "division_result",
+        "subtraction_large_inputs",
+        "multiplication_large_inputs",
+        "division_large_inputs",
+        "subtraction_large_integer_inputs",
+        "multiplication_large_integer_inputs",
+    ]
+)
+def test_get_result(calculation_type: str, inputs: list, expected: float) -> None:
+    """
+    Test that each Calculation subclass computes the expected result.
+
+    Steps:
+    1. Create a calculation through the 'Calculation.create' factory.
+    2. Assert that 'get_result' returns 'expected'.
+    """
+    calculation = Calculation.create(calculation_type, uuid.uuid4(), inputs)
+
+    assert type(calculation.get_result()) is type(expected)
+    assert calculation.get_result() == expected, \
+        f"Expected {calculation_type}({inputs}) to be {expected}, but got {calculation.get_result()}"
+
+
+def test_create_returns_subclass() -> None:
+    """
+    Test that the 'Calculation.create' factory returns the matching subclass, case-insensitively.
+    """
+    assert isinstance(Calculation.create("Addition", uuid.uuid4(), [1, 2]), Addition)
+    assert isinstance(Calculation.create("SUBTRACTION", uuid.uuid4(), [1, 2]), Subtraction)
+    assert isinstance(Calculation.create("multiplication", uuid.uuid4(), [1, 2]), Multiplication)
+    assert isinstance(Calculation.create("division", uuid.uuid4(), [1, 2]), Division)
+
+
+# ---------------------------------------------
+# Negative Test Cases
+# ---------------------------------------------
+
+def test_create_unsupported_type() -> None:
+    """
+    Test that the 'Calculation.create' factory rejects unknown calculation types.
+    """
+    with pytest.raises(ValueError) as excinfo:
+        Calculation.create("modulo", uuid.uuid4(), [1, 2])
+
+    assert "Unsupported calculation type" in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    "calculation_type, inputs",
+    [
+        ("addition", "1, 2"),      # Test inputs that are not a list
+        ("subtraction", [1]),      # Test subtraction with a single input
+        ("division", [1]),         # Test division with a single input
+    ],
+    ids=[
+        "inputs_not_a_list",
+        "subtraction_too_few_inputs",
+        "division_too_few_inputs",
+    ]
+)
+def test_invalid_inputs(calculation_type: str, inputs) -> None:
+    """
+    Test that invalid inputs are rejected when the calculation is created.
+    """
+    with pytest.raises(ValueError):
+        Calculation.create(calculation_type, uuid.uuid4(), inputs)
+
+
+def test_division_by_zero() -> None:
+    """
+    Test that dividing by zero raises a ValueError with the appropriate error message.
+    """
+    calculation = Calculation.create("division", uuid.uuid4(), [10, 2, 0])
+
+    with pytest.raises(ValueError) as excinfo:
+        calculation.get_result()
+
+    assert "Cannot divide by zero" in str(excinfo.value)
+
+
+# ---------------------------------------------
+# Unit Tests for 'uuid7'
+# ---------------------------------------------
+
+def test_uuid7_is_time_ordered() -> None:
+    """
+    Test that 'uuid7' produces RFC 9562 version 7 UUIDs that sort in creation order.
+    """
+    ids = [uuid7() for _ in range(1000)]
+
+    assert all(value.version == 7 and value.variant == uuid.RFC_4122 for value in ids)
+    assert len(set(ids)) == len(ids), "Expected every generated UUID to be unique"
+    assert ids[0].int >> 80 <= ids[-1].int >> 80, "Expected timestamps to be non-decreasing"
+
+
+# ---------------------------------------------
+# Tests for 'Calculation.bulk_create_copy'
+# ---------------------------------------------
+
+def test_bulk_create_copy(db_session) -> None:
+    """
+    Test that 'bulk_create_copy' persists every calculation with its defaults applied.
+
+    SQLite has no COPY, so this exercises the bulk_save_objects fallback.
+    """
+    user = User(first_name="Ada", last_name="Lovelace", email="ada@example.com",
+                username="ada", password="hashed")
+    db_session.add(user)
+    db_session.commit()
+
+    rows = [Calculation.create("addition", user.id, [i, i]) for i in range(5)]
+    rows.append(Calculation.create("division", user.id, [10, 2]))
+    Calculation.bulk_create_copy(db_session, rows)
+    db_session.commit()
+
+    assert all(row.id is not None and row.created_at is not None for row in rows)
+    assert db_session.query(Calculation).count() == 6
+    assert db_session.query(Division).one().get_result() == 5.0
+
+
+def test_bulk_create_copy_postgresql(db_session, monkeypatch) -> None:
+    """
+    Test the PostgreSQL COPY branch of 'bulk_create_copy' against a fake psycopg2 cursor.
+
+    Steps:
+    1. Add a user to the session without flushing it.
+    2. Pretend the database is PostgreSQL and capture what is sent to 'copy_expert'.
+    3. Assert that the user was flushed first and that the COPY statement and CSV rows are correct.
+    """
+    copied = {}
+
+    class FakeCursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def copy_expert(self, sql, buffer):
+            copied["sql"] = sql
+            copied["data"] = buffer.read()
+
+    class FakeConnection:
+        connection = type("RawConnection", (), {"cursor": lambda self: FakeCursor()})()
+
+    user = User(first_name="Ada", last_name="Lovelace", email="ada@example.com",
+                username="ada", password="hashed")
+    db_session.add(user)
+    user.id = uuid7()
+    rows = [Calculation.create("addition", user.id, [1, 2.5]), Calculation.create("division", user.id, [9, 3])]
+
+    monkeypatch.setattr(db_session.get_bind().dialect, "name", "postgresql")
+    monkeypatch.setattr(db_session, "connection", lambda: FakeConnection())
+    Calculation.bulk_create_copy(db_session, rows)
+
+    assert user not in db_session.new, "Expected pending users to be flushed before COPY"
+    assert copied["sql"] == (
+        "COPY calculations (id, user_id, type, inputs, created_at, updated_at) "
+        "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t')"
+    )
+    # The inputs JSON contains no tab, quote or newline, so csv.writer leaves it unquoted
+    assert "\t[1, 2.5]\t" in copied["data"] and '"' not in copied["data"]
+    records = list(csv.reader(io.StringIO(copied["data"]), delimiter="\t"))
+    assert [record[:3] for record in records] == [
+        [str(rows[0].id), str(user.id), "addition"],
+        [str(rows[1].id), str(user.id), "division"],
+    ]
+    assert [json.loads(record[3]) for record in records] == [[1, 2.5], [9, 3]]
+    assert records[0][4] == rows[0].created_at.isoformat()
+
+
+# ---------------------------------------------
+# Tests for 'Calculation.list_for_user'
+# ---------------------------------------------
+
+def test_list_for_user(db_session) -> None:
+    """
+    Test that 'list_for_user' returns only that user's calculations as their subclasses.
+    """
+    users = [
+        User(first_name="Ada", last_name="Lovelace", email="ada@example.com", username="ada", password="hashed"),
+        User(first_name="Alan", last_name="Turing", email="alan@example.com", username="alan", password="hashed"),
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+    db_session.add_all([
+        Calculation.create("addition", users[0].id, [1, 2]),
+        Calculation.create("multiplication", users[0].id, [3, 4]),
+        Calculation.create("subtraction", users[1].id, [5, 1]),
+    ])
+    db_session.commit()
+    user_id = users[0].id
+    db_session.expunge_all()
+
+    calculations = Calculation.list_for_user(db_session, user_id)
+
+    assert sorted(type(c).__name__ for c in calculations) == ["Addition", "Multiplication"]
+    assert sorted(c.get_result() for c in calculations) == [3, 12]
@@ -58,7 +58,14 @@ DATABASE_URL = f'postgresql://{settings.db_user}:{settings.db_password}@{setting
 
 # Initialize SQLAlchemy base and engine
 Base = declarative_base()
-engine = create_engine(DATABASE_URL, echo=True)  # echo=True for SQL logging
+# psycopg2 fast execution helpers: multi-row VALUES for INSERTs, execute_batch for UPDATEs
+engine = create_engine(
+    DATABASE_URL,
+    echo=True,  # echo=True for SQL logging
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+)
 
 
 # Create a session maker